@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 import shlex
 import signal
 import subprocess
 import sys
+import termios
+import threading
+import time
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
@@ -16,8 +20,8 @@ from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.css.query import NoMatches
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Log, Select, Static
 from textual.worker import Worker, WorkerState
 
@@ -26,10 +30,11 @@ if __package__ in (None, ""):
     from aws_tui.aws_api import (
         DEFAULT_PROFILE,
         DEFAULT_REGION,
-        AwsEc2Service,
         AwsInstance,
         build_mock_instances,
+        get_ec2_service,
         is_aws_cli_available,
+        list_instances_multi,
     )
     from aws_tui.models import InstanceSummary
     from aws_tui.port_config import PortForwardConfig, load_port_forward_config
@@ -43,10 +48,11 @@ else:
     from .aws_api import (
         DEFAULT_PROFILE,
         DEFAULT_REGION,
-        AwsEc2Service,
         AwsInstance,
         build_mock_instances,
+        get_ec2_service,
         is_aws_cli_available,
+        list_instances_multi,
     )
     from .models import InstanceSummary
     from .port_config import PortForwardConfig, load_port_forward_config
@@ -58,6 +64,52 @@ else:
     )
 
 
+def _instance_row_cells(instance: InstanceSummary) -> tuple[str, ...]:
+    return (
+        instance.display_name,
+        instance.instance_id,
+        instance.state,
+        instance.instance_type,
+        instance.private_ip or "-",
+        instance.public_ip or "-",
+        instance.availability_zone or "-",
+    )
+
+
+@lru_cache(maxsize=512)
+def _ssm_shell_command(instance_id: str, profile: str, region: str) -> tuple[str, ...]:
+    return tuple(
+        AwsInstance(instance_id=instance_id, profile=profile, region=region).build_ssm_shell_command()
+    )
+
+
+@lru_cache(maxsize=512)
+def _port_forward_command(
+    instance_id: str,
+    profile: str,
+    region: str,
+    remote_port: int,
+    local_port: int,
+) -> tuple[str, ...]:
+    return tuple(
+        AwsInstance(instance_id=instance_id, profile=profile, region=region).build_port_forward_command(
+            remote_port=remote_port,
+            local_port=local_port,
+        )
+    )
+
+
+# Tokens from this alphabet render identically with or without quoting.
+_SAFE_TOKEN = re.compile(r"^[A-Za-z0-9_\-./:=+,]+$")
+
+
+@lru_cache(maxsize=512)
+def _command_text(command: tuple[str, ...]) -> str:
+    return " ".join(
+        part if _SAFE_TOKEN.match(part) else shlex.quote(part) for part in command
+    )
+
+
 @dataclass(slots=True)
 class ActivePortForwardRuntime:
     record_id: str
@@ -73,7 +125,7 @@ class PortForwardScreen(ModalScreen[tuple[str, int, int] | None]):
     def __init__(self, config: PortForwardConfig) -> None:
         super().__init__()
         self.config = config
-        self.preset_by_key = {preset.key: preset for preset in self.config.presets}
+        self.preset_by_key = config.preset_by_key
 
     def compose(self) -> ComposeResult:
         with Vertical(id="port-modal"):
@@ -98,6 +150,11 @@ class PortForwardScreen(ModalScreen[tuple[str, int, int] | None]):
                 yield Button("Cancel", id="cancel-port")
                 yield Button("Add", variant="primary", id="add-port")
 
+    def on_mount(self) -> None:
+        self._name_input = self.query_one("#forward-name", Input)
+        self._remote_input = self.query_one("#remote-port", Input)
+        self._local_input = self.query_one("#local-port", Input)
+
     @on(Select.Changed, "#port-preset")
     def on_preset_changed(self, event: Select.Changed) -> None:
         if event.value == Select.BLANK:
@@ -106,9 +163,9 @@ class PortForwardScreen(ModalScreen[tuple[str, int, int] | None]):
             preset = self.preset_by_key[str(event.value)]
         except KeyError:
             return
-        self.query_one("#forward-name", Input).value = _name_from_preset_label(preset.label)
-        self.query_one("#remote-port", Input).value = str(preset.remote_port)
-        self.query_one("#local-port", Input).value = str(preset.local_port)
+        self._name_input.value = _name_from_preset_label(preset.label)
+        self._remote_input.value = str(preset.remote_port)
+        self._local_input.value = str(preset.local_port)
 
     async def action_cancel(self) -> None:
         self.dismiss(None)
@@ -117,12 +174,12 @@ class PortForwardScreen(ModalScreen[tuple[str, int, int] | None]):
         if event.button.id == "cancel-port":
             self.dismiss(None)
             return
-        forward_name = self.query_one("#forward-name", Input).value.strip()
+        forward_name = self._name_input.value.strip()
         if not forward_name:
             self.app.notify("Forward name is required.", severity="error")
             return
-        remote_port = _parse_port(self.query_one("#remote-port", Input).value.strip())
-        local_port = _parse_port(self.query_one("#local-port", Input).value.strip())
+        remote_port = _parse_port(self._remote_input.value.strip())
+        local_port = _parse_port(self._local_input.value.strip())
         if remote_port is None or local_port is None:
             self.app.notify("Ports must be between 1 and 65535", severity="error")
             return
@@ -137,11 +194,16 @@ class InstanceInfoScreen(ModalScreen[None]):
         Binding("x", "stop_selected", "Stop"),
     ]
 
+    HISTORY_PAGE_SIZE = 200
+    HISTORY_FETCH_MARGIN = 20
+
     def __init__(self, instance: InstanceSummary) -> None:
         super().__init__()
         self.instance = instance
         self.active_records: list[PortForwardRecord] = []
         self.history_records: list[PortForwardRecord] = []
+        self._history_offset = 0
+        self._history_exhausted = False
 
     def compose(self) -> ComposeResult:
         with Vertical(id="instance-info-modal"):
@@ -161,13 +223,13 @@ class InstanceInfoScreen(ModalScreen[None]):
             yield DataTable(id="forward-history-table")
 
     def on_mount(self) -> None:
-        active_table = self.query_one("#active-forwards-table", DataTable)
-        active_table.cursor_type = "row"
-        active_table.add_columns("Forward Name", "Local", "Remote", "Status", "Started", "Command")
+        self._active_table = self.query_one("#active-forwards-table", DataTable)
+        self._active_table.cursor_type = "row"
+        self._active_table.add_columns("Forward Name", "Local", "Remote", "Status", "Started", "Command")
 
-        history_table = self.query_one("#forward-history-table", DataTable)
-        history_table.cursor_type = "row"
-        history_table.add_columns("Forward Name", "Local", "Remote", "Status", "Started", "Ended")
+        self._history_table = self.query_one("#forward-history-table", DataTable)
+        self._history_table.cursor_type = "row"
+        self._history_table.add_columns("Forward Name", "Local", "Remote", "Status", "Started", "Ended")
         self.action_refresh()
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -217,14 +279,17 @@ class InstanceInfoScreen(ModalScreen[None]):
     def action_refresh(self) -> None:
         app = cast(AwsTuiApp, self.app)
         active = app.get_active_forwards_for_instance(self.instance.instance_id)
-        history = app.get_history_for_instance(self.instance.instance_id)
+        history = app.get_history_for_instance(
+            self.instance.instance_id,
+            limit=self.HISTORY_PAGE_SIZE,
+        )
 
         self.active_records = active
         self.history_records = history
-        active_table = self.query_one("#active-forwards-table", DataTable)
-        active_table.clear(columns=False)
-        for record in active:
-            active_table.add_row(
+        self._history_offset = len(history)
+        self._history_exhausted = len(history) < self.HISTORY_PAGE_SIZE
+        active_rows = [
+            (
                 record.forward_name,
                 str(record.local_port),
                 str(record.remote_port),
@@ -232,13 +297,53 @@ class InstanceInfoScreen(ModalScreen[None]):
                 _format_timestamp(record.started_at),
                 _truncate(record.command, 58),
             )
-        if active:
-            active_table.move_cursor(row=0, column=0)
+            for record in active
+        ]
+        history_rows = [
+            (
+                record.forward_name,
+                str(record.local_port),
+                str(record.remote_port),
+                record.status,
+                _format_timestamp(record.started_at),
+                _format_timestamp(record.ended_at),
+            )
+            for record in history
+        ]
+        with self.app.batch_update():
+            self._active_table.clear(columns=False)
+            self._active_table.add_rows(active_rows)
+            if active:
+                self._active_table.move_cursor(row=0, column=0)
+
+            self._history_table.clear(columns=False)
+            self._history_table.add_rows(history_rows)
+            if history:
+                self._history_table.move_cursor(row=0, column=0)
 
-        history_table = self.query_one("#forward-history-table", DataTable)
-        history_table.clear(columns=False)
-        for record in history:
-            history_table.add_row(
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        if event.data_table.id != "forward-history-table":
+            return
+        if event.cursor_row >= len(self.history_records) - self.HISTORY_FETCH_MARGIN:
+            self._append_history_page()
+
+    def _append_history_page(self) -> None:
+        if self._history_exhausted:
+            return
+        app = cast(AwsTuiApp, self.app)
+        page = app.get_history_for_instance(
+            self.instance.instance_id,
+            limit=self.HISTORY_PAGE_SIZE,
+            offset=self._history_offset,
+        )
+        if len(page) < self.HISTORY_PAGE_SIZE:
+            self._history_exhausted = True
+        if not page:
+            return
+        self.history_records.extend(page)
+        self._history_offset += len(page)
+        self._history_table.add_rows(
+            (
                 record.forward_name,
                 str(record.local_port),
                 str(record.remote_port),
@@ -246,28 +351,16 @@ class InstanceInfoScreen(ModalScreen[None]):
                 _format_timestamp(record.started_at),
                 _format_timestamp(record.ended_at),
             )
-        if history:
-            history_table.move_cursor(row=0, column=0)
+            for record in page
+        )
 
     def _selected_active_record(self) -> PortForwardRecord | None:
-        table = self.query_one("#active-forwards-table", DataTable)
-        try:
-            row = table.cursor_row
-            if row < 0:
-                raise IndexError
-            return self.active_records[row]
-        except IndexError:
-            return None
+        row = self._active_table.cursor_row
+        return self.active_records[row] if 0 <= row < len(self.active_records) else None
 
     def _selected_history_record(self) -> PortForwardRecord | None:
-        table = self.query_one("#forward-history-table", DataTable)
-        try:
-            row = table.cursor_row
-            if row < 0:
-                raise IndexError
-            return self.history_records[row]
-        except IndexError:
-            return None
+        row = self._history_table.cursor_row
+        return self.history_records[row] if 0 <= row < len(self.history_records) else None
 
     def _instance_meta_text(self) -> str:
         return (
@@ -301,14 +394,16 @@ class QuitConfirmScreen(ModalScreen[bool]):
         table = self.query_one("#quit-active-table", DataTable)
         table.cursor_type = "row"
         table.add_columns("Forward", "Machine", "Local", "Remote", "Status")
-        for record in self.active_records:
-            table.add_row(
+        table.add_rows(
+            (
                 record.forward_name,
                 f"{record.instance_name} ({record.instance_id})",
                 str(record.local_port),
                 str(record.remote_port),
                 record.status,
             )
+            for record in self.active_records
+        )
         if self.active_records:
             table.move_cursor(row=0, column=0)
 
@@ -326,6 +421,9 @@ class AwsTuiApp(App[None]):
     CSS_PATH = "styles.tcss"
     TITLE = "AWS EC2 TUI"
     SUB_TITLE = "SSM connect + port forwarding"
+    INSTANCE_CACHE_TTL = 30.0
+    INSTANCE_RENDER_PAGE = 500
+    INSTANCE_FETCH_MARGIN = 50
     BINDINGS = [
         Binding("r", "refresh", "Refresh"),
         Binding("c", "connect", "Connect (SSM)"),
@@ -350,8 +448,26 @@ class AwsTuiApp(App[None]):
         self.history_store = PortForwardHistoryStore(history_file)
         self.active_port_forwards: dict[str, ActivePortForwardRuntime] = {}
         self.instances: list[InstanceSummary] = []
+        self._instance_rows: list[tuple[str, ...]] = []
+        self._instances_by_row: list[InstanceSummary] = []
+        self._instances_by_id: dict[str, InstanceSummary] = {}
         self.current_command = ""
         self.exit_in_progress = False
+        self._preview_timer: Timer | None = None
+        self._preview_key: tuple[str, str, str] | None = None
+        self._log_second = -1
+        self._log_timestamp = ""
+        self._load_generation = 0
+        self._rendered_sig: int | None = None
+        self._instance_table: DataTable | None = None
+        self._profile_input: Input | None = None
+        self._region_input: Input | None = None
+        self._command_preview_input: Input | None = None
+        self._status_widget: Static | None = None
+        self._activity_log: Log | None = None
+        self._instance_cache: dict[
+            tuple[str, str], tuple[float, list[tuple[InstanceSummary, tuple[str, ...]]]]
+        ] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -378,9 +494,14 @@ class AwsTuiApp(App[None]):
 
     def on_mount(self) -> None:
         table = self.query_one("#instance-table", DataTable)
+        self._instance_table = table
+        self._profile_input = self.query_one("#profile", Input)
+        self._region_input = self.query_one("#region", Input)
+        self._command_preview_input = self.query_one("#command-preview", Input)
+        self._status_widget = self.query_one("#status", Static)
+        self._activity_log = self.query_one("#activity-log", Log)
         table.cursor_type = "row"
         table.add_columns("Name", "Instance ID", "State", "Type", "Private IP", "Public IP", "AZ")
-        self.set_interval(1.0, self._poll_active_port_forwards)
 
         if not self.aws_cli_available:
             self._log("AWS CLI not found. Running in simulated mode.")
@@ -389,13 +510,59 @@ class AwsTuiApp(App[None]):
         self._log("Press Enter on an instance to open details (Add new, Start stopped, Stop active).")
         self._log("App started.")
         self.set_focus(table)
-        self.action_refresh()
+        self._refresh_instances(ignore_cache=False)
 
     @work(thread=True, exclusive=True, name="load-instances")
-    def load_instances(self, profile: str, region: str) -> list[InstanceSummary]:
+    def load_instances(
+        self,
+        profile: str,
+        region: str,
+        generation: int,
+        *,
+        ignore_cache: bool = False,
+    ) -> list[tuple[InstanceSummary, tuple[str, ...]]]:
+        regions = [part.strip() for part in region.split(",") if part.strip()]
         if not self.aws_cli_available:
-            return build_mock_instances(region=region)
-        return AwsEc2Service(profile=profile, region=region).list_instances()
+            summaries = build_mock_instances(region=regions[0] if regions else region)
+        elif len(regions) > 1:
+            summaries = list_instances_multi(regions, profile, ignore_cache=ignore_cache)
+        else:
+
+            def on_page(batch: list[InstanceSummary]) -> None:
+                pairs = [(summary, _instance_row_cells(summary)) for summary in batch]
+                self.call_from_thread(self._append_instance_page, generation, pairs)
+
+            summaries = get_ec2_service(profile, region).list_instances(
+                ignore_cache=ignore_cache,
+                on_page=on_page,
+            )
+        # Format row cells here so the UI thread only has to append them.
+        return [(summary, _instance_row_cells(summary)) for summary in summaries]
+
+    def _append_instance_page(
+        self,
+        generation: int,
+        pairs: list[tuple[InstanceSummary, tuple[str, ...]]],
+    ) -> None:
+        """Show a page of instances as soon as it arrives; final sort happens on completion."""
+        if generation != self._load_generation or self._instance_table is None:
+            return
+        first_page = not self.instances
+        if first_page:
+            self._instance_table.clear(columns=False)
+        # The table no longer mirrors a completed render.
+        self._rendered_sig = None
+        for summary, cells in pairs:
+            self.instances.append(summary)
+            self._instance_rows.append(cells)
+            self._instances_by_row.append(summary)
+            self._instances_by_id[summary.instance_id] = summary
+        self._instance_table.add_rows(cells for _, cells in pairs)
+        if first_page and pairs:
+            self._instance_table.move_cursor(row=0, column=0)
+        self._set_status(
+            f"Loading instances from {self.region} ({self.profile})... {len(self.instances)} so far."
+        )
 
     @on(Worker.StateChanged)
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
@@ -405,7 +572,10 @@ class AwsTuiApp(App[None]):
         if event.worker.state == WorkerState.SUCCESS:
             result = event.worker.result
             if isinstance(result, list):
-                self.instances = cast(list[InstanceSummary], result)
+                loaded = cast(list[tuple[InstanceSummary, tuple[str, ...]]], result)
+                self._instance_cache[(self.profile, self.region)] = (time.monotonic(), loaded)
+                self.instances = [summary for summary, _ in loaded]
+                self._instance_rows = [cells for _, cells in loaded]
                 self._render_instances()
                 mode = "simulated " if not self.aws_cli_available else ""
                 self._set_status(
@@ -418,6 +588,7 @@ class AwsTuiApp(App[None]):
 
         if event.worker.state == WorkerState.ERROR:
             self.instances = []
+            self._instance_rows = []
             self._render_instances()
             error = event.worker.error
             self._set_status(f"Failed to load instances: {error}")
@@ -461,11 +632,17 @@ class AwsTuiApp(App[None]):
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id in {"profile", "region"}:
-            self.action_refresh()
+            self._refresh_instances(ignore_cache=False)
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
-        if event.data_table.id == "instance-table":
-            self._update_command_preview_for_selection()
+        if event.data_table.id != "instance-table":
+            return
+        if event.cursor_row >= len(self._instances_by_row) - self.INSTANCE_FETCH_MARGIN:
+            self._append_instance_render_page()
+        # Coalesce key-repeat bursts so only the final selection builds a preview.
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(0.04, self._update_command_preview_for_selection)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         if event.data_table.id != "instance-table":
@@ -476,11 +653,45 @@ class AwsTuiApp(App[None]):
         self.push_screen(InstanceInfoScreen(instance))
 
     def action_refresh(self) -> None:
+        self._refresh_instances(ignore_cache=True)
+
+    def _refresh_instances(self, *, ignore_cache: bool) -> None:
         self.profile, self.region = self._current_settings()
+        if not ignore_cache:
+            cached = self._instance_cache.get((self.profile, self.region))
+            if cached is not None and time.monotonic() - cached[0] < self.INSTANCE_CACHE_TTL:
+                # Drop any in-flight load so its result cannot overwrite the
+                # cached view; the bumped generation also discards streamed
+                # pages from that load still queued on the UI thread.
+                self._load_generation += 1
+                for worker in self.workers:
+                    if worker.name == "load-instances":
+                        worker.cancel()
+                loaded = cached[1]
+                self.instances = [summary for summary, _ in loaded]
+                self._instance_rows = [cells for _, cells in loaded]
+                self._render_instances()
+                self._set_status(
+                    f"Loaded {len(self.instances)} cached instances from {self.region} ({self.profile})."
+                )
+                return
+        self._load_generation += 1
+        self.instances = []
+        self._instance_rows = []
+        self._instances_by_row = []
+        self._instances_by_id = {}
+        # The emptied indexes no longer match the rows still on screen, so
+        # the next render must not fingerprint-skip the index rebuild.
+        self._rendered_sig = None
         self._set_status(f"Loading instances from {self.region} ({self.profile})...")
         self._set_command_preview("")
         self._log(f"Refreshing instances for {self.region} ({self.profile}).")
-        self.load_instances(self.profile, self.region)
+        self.load_instances(
+            self.profile,
+            self.region,
+            self._load_generation,
+            ignore_cache=ignore_cache,
+        )
 
     async def action_connect(self) -> None:
         instance = self._selected_instance()
@@ -489,11 +700,11 @@ class AwsTuiApp(App[None]):
             self._log("Connect requested with no selected instance.")
             return
 
-        command = AwsInstance(
-            instance_id=instance.instance_id,
-            profile=self.profile,
-            region=self.region,
-        ).build_ssm_shell_command()
+        command = _ssm_shell_command(
+            instance.instance_id,
+            self.profile,
+            instance.region or self.region,
+        )
         self._show_command(command)
         if not self.aws_cli_available:
             self._set_status("Simulated SSM session (AWS CLI not installed).")
@@ -554,13 +765,15 @@ class AwsTuiApp(App[None]):
         *,
         forward_name: str,
     ) -> PortForwardRecord | None:
-        command = AwsInstance(
-            instance_id=instance.instance_id,
-            profile=self.profile,
-            region=self.region,
-        ).build_port_forward_command(remote_port=remote_port, local_port=local_port)
+        command = _port_forward_command(
+            instance.instance_id,
+            self.profile,
+            instance.region or self.region,
+            remote_port,
+            local_port,
+        )
         self._show_command(command)
-        command_text = shlex.join(command)
+        command_text = _command_text(command)
 
         if not self.aws_cli_available:
             record = self.history_store.create(
@@ -591,12 +804,15 @@ class AwsTuiApp(App[None]):
             f"Starting SSM port forwarding local {local_port} to {instance.instance_id}:{remote_port}."
         )
         try:
+            # close_fds=False skips the per-spawn walk over /proc/self/fd;
+            # all three std streams are already redirected to DEVNULL.
             process = subprocess.Popen(
                 command,
                 stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 start_new_session=True,
+                close_fds=False,
             )
         except OSError as error:
             record = self.history_store.create(
@@ -628,6 +844,7 @@ class AwsTuiApp(App[None]):
             instance_id=record.instance_id,
             process=process,
         )
+        self._watch_forward(record.record_id, process)
         self._set_status("SSM port forwarding started in background.")
         self._log(
             f"Port forward '{forward_name}' active ({local_port} -> {instance.instance_id}:{remote_port})."
@@ -660,75 +877,150 @@ class AwsTuiApp(App[None]):
             return True
 
         runtime.stopping = True
-        self._terminate_process(runtime.process)
-        exit_code = runtime.process.poll()
+        self.active_port_forwards.pop(record_id, None)
+        self._stop_forward_process(runtime, record, emit_ui)
+        return True
+
+    @work(thread=True, exclusive=False, name="stop-forward")
+    def _stop_forward_process(
+        self,
+        runtime: ActivePortForwardRuntime,
+        record: PortForwardRecord,
+        emit_ui: bool,
+    ) -> None:
+        process = cast(subprocess.Popen[bytes], runtime.process)
+        self._terminate_process(process)
+        self.call_from_thread(self._record_forward_stopped, record, process.poll(), emit_ui)
+
+    def _record_forward_stopped(
+        self,
+        record: PortForwardRecord,
+        exit_code: int | None,
+        emit_ui: bool,
+    ) -> None:
         status = "stopped" if exit_code in (0, None, -signal.SIGTERM, -signal.SIGKILL) else "failed"
         self.history_store.update(
-            record_id,
+            record.record_id,
             status=status,
             ended_at=utc_now(),
             note=f"Stopped by user (exit={exit_code}).",
         )
-        self.active_port_forwards.pop(record_id, None)
         if emit_ui:
             self._set_status("Stopped selected port forward.")
             self._log(
                 f"Stopped port forward '{record.forward_name}' "
                 f"({record.local_port} -> {record.instance_id}:{record.remote_port})."
             )
-        return True
 
     def get_active_forwards_for_instance(self, instance_id: str) -> list[PortForwardRecord]:
-        records: list[PortForwardRecord] = []
-        for runtime in self.active_port_forwards.values():
-            if runtime.instance_id != instance_id:
-                continue
-            record = self.history_store.get(runtime.record_id)
-            if record is not None:
-                records.append(record)
+        records = list(
+            self.history_store.get_many(
+                runtime.record_id
+                for runtime in self.active_port_forwards.values()
+                if runtime.instance_id == instance_id
+            ).values()
+        )
         records.sort(key=lambda item: item.started_at, reverse=True)
         return records
 
     def get_all_active_forwards(self) -> list[PortForwardRecord]:
-        records: list[PortForwardRecord] = []
-        for runtime in self.active_port_forwards.values():
-            record = self.history_store.get(runtime.record_id)
-            if record is not None:
-                records.append(record)
+        records = list(
+            self.history_store.get_many(
+                runtime.record_id for runtime in self.active_port_forwards.values()
+            ).values()
+        )
         records.sort(key=lambda item: item.started_at, reverse=True)
         return records
 
-    def get_history_for_instance(self, instance_id: str) -> list[PortForwardRecord]:
-        return self.history_store.list_for_instance(instance_id)
+    def get_history_for_instance(
+        self,
+        instance_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[PortForwardRecord]:
+        return self.history_store.list_for_instance(instance_id, limit=limit, offset=offset)
 
     def shutdown_active_port_forwards(self, *, emit_ui: bool = True) -> None:
-        for record_id in tuple(self.active_port_forwards):
-            self.stop_port_forward(record_id, emit_ui=emit_ui)
-
-    def _poll_active_port_forwards(self) -> None:
-        for record_id, runtime in tuple(self.active_port_forwards.items()):
-            process = runtime.process
-            if runtime.simulated or process is None:
-                continue
+        runtimes = list(self.active_port_forwards.values())
+        self.active_port_forwards.clear()
+        if not runtimes:
+            return
 
-            exit_code = process.poll()
-            if exit_code is None:
-                continue
+        processes = [
+            runtime.process
+            for runtime in runtimes
+            if not runtime.simulated and runtime.process is not None
+        ]
+        for runtime in runtimes:
+            runtime.stopping = True
+        # Signal every process before waiting on any of them so the waits
+        # overlap instead of paying the timeout once per forward.
+        for process in processes:
+            _signal_process_group(process, signal.SIGTERM)
+        _wait_for_processes(processes, timeout=3)
+        survivors = [process for process in processes if process.poll() is None]
+        for process in survivors:
+            _signal_process_group(process, signal.SIGKILL)
+        _wait_for_processes(survivors, timeout=2)
+
+        ended_at = utc_now()
+        updates: list[tuple[str, str, str | None, str | None]] = []
+        for runtime in runtimes:
+            if runtime.simulated or runtime.process is None:
+                status = "simulated-stopped" if runtime.simulated else "stopped"
+                note = "Stopped by user."
+            else:
+                exit_code = runtime.process.poll()
+                status = (
+                    "stopped"
+                    if exit_code in (0, None, -signal.SIGTERM, -signal.SIGKILL)
+                    else "failed"
+                )
+                note = f"Stopped by user (exit={exit_code})."
+            updates.append((runtime.record_id, status, ended_at, note))
+        self.history_store.update_many(updates)
+        if emit_ui:
+            self._set_status("Stopped all active port forwards.")
+            self._log(f"Stopped {len(runtimes)} active port forward(s).")
+
+    def _watch_forward(self, record_id: str, process: subprocess.Popen[bytes]) -> None:
+        # Deliberately a plain daemon thread, not a worker: workers run on
+        # the event loop's default executor, which asyncio joins at
+        # teardown, so a watcher blocked in wait() on a live forward would
+        # wedge abnormal exits (crash, SIGTERM) until the SSM process died.
+        # A daemon thread never blocks teardown; main()'s finally still
+        # terminates the processes and records their outcome.
+        def watch() -> None:
+            exit_code = process.wait()
+            try:
+                self.call_from_thread(self._finalize_forward, record_id, exit_code)
+            except RuntimeError:
+                # App already shut down; shutdown_active_port_forwards
+                # records the outcome instead.
+                pass
+
+        threading.Thread(target=watch, name=f"watch-forward-{record_id}", daemon=True).start()
+
+    def _finalize_forward(self, record_id: str, exit_code: int) -> None:
+        runtime = self.active_port_forwards.pop(record_id, None)
+        if runtime is None:
+            # stop_port_forward already recorded the outcome.
+            return
 
-            status = "stopped" if runtime.stopping else ("completed" if exit_code == 0 else "failed")
-            self.history_store.update(
-                record_id,
-                status=status,
-                ended_at=utc_now(),
-                note=f"Process ended (exit={exit_code}).",
+        status = "stopped" if runtime.stopping else ("completed" if exit_code == 0 else "failed")
+        self.history_store.update(
+            record_id,
+            status=status,
+            ended_at=utc_now(),
+            note=f"Process ended (exit={exit_code}).",
+        )
+        record = self.history_store.get(record_id)
+        if record is not None:
+            self._log(
+                f"Port forward '{record.forward_name}' ended ({record.local_port} -> "
+                f"{record.instance_id}:{record.remote_port}, status={status})."
             )
-            record = self.history_store.get(record_id)
-            self.active_port_forwards.pop(record_id, None)
-            if record is not None:
-                self._log(
-                    f"Port forward '{record.forward_name}' ended ({record.local_port} -> "
-                    f"{record.instance_id}:{record.remote_port}, status={status})."
-                )
 
     def _terminate_process(self, process: subprocess.Popen[bytes]) -> None:
         if process.poll() is not None:
@@ -752,67 +1044,79 @@ class AwsTuiApp(App[None]):
             pass
 
     def _current_settings(self) -> tuple[str, str]:
-        profile = self.query_one("#profile", Input).value.strip() or DEFAULT_PROFILE
-        region = self.query_one("#region", Input).value.strip() or DEFAULT_REGION
+        if self._profile_input is None or self._region_input is None:
+            return self.profile, self.region
+        profile = self._profile_input.value.strip() or DEFAULT_PROFILE
+        region = self._region_input.value.strip() or DEFAULT_REGION
         return profile, region
 
     def _selected_instance(self) -> InstanceSummary | None:
-        table = self.query_one("#instance-table", DataTable)
-        try:
-            row = table.cursor_row
-            if row < 0:
-                raise IndexError
-            return self.instances[row]
-        except IndexError:
+        if self._instance_table is None:
             return None
+        row = self._instance_table.cursor_row
+        return self._instances_by_row[row] if 0 <= row < len(self._instances_by_row) else None
 
     def _render_instances(self) -> None:
-        table = self.query_one("#instance-table", DataTable)
-        table.clear(columns=False)
-        for instance in self.instances:
-            table.add_row(
-                instance.display_name,
-                instance.instance_id,
-                instance.state,
-                instance.instance_type,
-                instance.private_ip or "-",
-                instance.public_ip or "-",
-                instance.availability_zone or "-",
-            )
+        if self._instance_table is None:
+            return
+        table = self._instance_table
+        sig = hash(tuple(self.instances))
+        if sig == self._rendered_sig:
+            # The table already shows exactly these rows.
+            return
+        self._rendered_sig = sig
+        self._instances_by_id = {instance.instance_id: instance for instance in self.instances}
+        # Materialize only the first window; more rows are appended as the
+        # cursor approaches the bottom, keeping initial paint O(window).
+        self._instances_by_row = self.instances[: self.INSTANCE_RENDER_PAGE]
+        with self.batch_update():
+            table.clear(columns=False)
+            table.add_rows(self._instance_rows[: self.INSTANCE_RENDER_PAGE])
+            if self.instances:
+                table.move_cursor(row=0, column=0)
         if self.instances:
-            table.move_cursor(row=0, column=0)
             self._update_command_preview_for_selection()
         else:
             self._set_command_preview("")
 
-    def _set_status(self, message: str) -> None:
-        try:
-            self.query_one("#status", Static).update(message)
-        except NoMatches:
+    def _append_instance_render_page(self) -> None:
+        if self._instance_table is None:
+            return
+        rendered = len(self._instances_by_row)
+        if rendered >= len(self.instances):
             return
+        end = rendered + self.INSTANCE_RENDER_PAGE
+        self._instances_by_row.extend(self.instances[rendered:end])
+        self._instance_table.add_rows(self._instance_rows[rendered:end])
 
-    def _show_command(self, command: list[str]) -> None:
-        self._set_command_preview(shlex.join(command))
+    def _set_status(self, message: str) -> None:
+        if self._status_widget is not None:
+            self._status_widget.update(message)
+
+    def _show_command(self, command: tuple[str, ...]) -> None:
+        self._set_command_preview(_command_text(command))
 
     def _set_command_preview(self, message: str) -> None:
+        # Any direct write invalidates the selection-derived preview key.
+        self._preview_key = None
         self.current_command = message.strip()
-        try:
-            self.query_one("#command-preview", Input).value = self.current_command
-        except NoMatches:
-            return
+        if self._command_preview_input is not None:
+            self._command_preview_input.value = self.current_command
 
     def _update_command_preview_for_selection(self) -> None:
         instance = self._selected_instance()
         if instance is None:
+            self._preview_key = None
             self._set_command_preview("")
             return
         profile, region = self._current_settings()
-        command = AwsInstance(
-            instance_id=instance.instance_id,
-            profile=profile,
-            region=region,
-        ).build_ssm_shell_command()
-        self._show_command(command)
+        # The region input may name several regions; target the instance's own.
+        region = instance.region or region
+        key = (instance.instance_id, profile, region)
+        if key == self._preview_key:
+            return
+        self._show_command(_ssm_shell_command(instance.instance_id, profile, region))
+        self._preview_key = key
 
     def action_copy_command(self) -> None:
         if not self.current_command:
@@ -824,11 +1128,32 @@ class AwsTuiApp(App[None]):
         self._log("Copied command to clipboard.")
 
     def _log(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        try:
-            self.query_one("#activity-log", Log).write_line(f"[{timestamp}] {message}")
-        except NoMatches:
+        if self._activity_log is None:
             return
+        # Reuse the formatted timestamp for log lines within the same second.
+        now = int(time.time())
+        if now != self._log_second:
+            self._log_second = now
+            self._log_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        self._activity_log.write_line(f"[{self._log_timestamp}] {message}")
+
+
+def _signal_process_group(process: subprocess.Popen[bytes], signum: int) -> None:
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, signum)
+    except OSError:
+        process.send_signal(signum)
+
+
+def _wait_for_processes(processes: Sequence[subprocess.Popen[bytes]], timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        try:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            continue
 
 
 def _parse_port(value: str) -> int | None:
@@ -841,12 +1166,14 @@ def _parse_port(value: str) -> int | None:
     return port
 
 
+@lru_cache(maxsize=4096)
 def _format_timestamp(value: str | None) -> str:
     if not value:
         return "-"
     return value.replace("T", " ").replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=1024)
 def _truncate(value: str, max_length: int) -> str:
     if len(value) <= max_length:
         return value
@@ -865,7 +1192,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "--ports-config",
         default="port-forwards.yaml",
-        help="YAML file for SSM port-forward defaults and presets",
+        help="YAML, JSON, or TOML file for SSM port-forward defaults and presets",
     )
     parser.add_argument(
         "--history-file",
@@ -877,6 +1204,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
 def main(argv: Sequence[str] | None = None) -> None:
     args = parse_args(argv)
+    saved_terminal_attrs = _capture_terminal_state()
     app = AwsTuiApp(
         profile=args.profile,
         region=args.region,
@@ -889,27 +1217,33 @@ def main(argv: Sequence[str] | None = None) -> None:
         pass
     finally:
         app.shutdown_active_port_forwards(emit_ui=False)
-        _restore_terminal_state()
+        _restore_terminal_state(saved_terminal_attrs)
 
 
-def _restore_terminal_state() -> None:
-    if not sys.stdout.isatty():
-        return
-    try:
-        sys.stdout.write("\x1b[?1000l\x1b[?1002l\x1b[?1003l\x1b[?1006l\x1b[?1015l\x1b[?25h")
-        sys.stdout.flush()
-    except OSError:
-        pass
+# Disable mouse tracking modes and re-show the cursor.
+_TERMINAL_RESET_SEQUENCE = b"\x1b[?1000l\x1b[?1002l\x1b[?1003l\x1b[?1006l\x1b[?1015l\x1b[?25h"
+
+
+def _capture_terminal_state() -> list[object] | None:
     if not sys.stdin.isatty():
+        return None
+    try:
+        return termios.tcgetattr(sys.stdin.fileno())
+    except (termios.error, OSError, ValueError):
+        return None
+
+
+def _restore_terminal_state(saved_attrs: list[object] | None) -> None:
+    if sys.stdout.isatty():
+        try:
+            os.write(sys.stdout.fileno(), _TERMINAL_RESET_SEQUENCE)
+        except OSError:
+            pass
+    if saved_attrs is None:
         return
     try:
-        subprocess.run(
-            ["stty", "sane"],
-            check=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    except OSError:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, saved_attrs)
+    except (termios.error, OSError, ValueError):
         pass
 
 
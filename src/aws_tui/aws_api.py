@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import json
 import shutil
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import boto3
@@ -14,10 +18,28 @@ DEFAULT_PROFILE = "default"
 DEFAULT_REGION = "us-west-1"
 
 
+@lru_cache(maxsize=16)
+def _get_session(profile: str, region: str) -> boto3.Session:
+    # Session construction resolves config files and credential chains;
+    # reuse one per (profile, region) across refreshes.
+    return boto3.Session(profile_name=profile, region_name=region)
+
+
 def is_aws_cli_available() -> bool:
     return shutil.which("aws") is not None
 
 
+@lru_cache(maxsize=256)
+def _encode_port_forward_params(remote_port: int, local_port: int) -> str:
+    return json.dumps(
+        {
+            "portNumber": [str(remote_port)],
+            "localPortNumber": [str(local_port)],
+        },
+        separators=(",", ":"),
+    )
+
+
 @dataclass(slots=True, frozen=True)
 class AwsInstance:
     instance_id: str
@@ -32,18 +54,12 @@ class AwsInstance:
           "command=[/bin/bash]"]
 
     def build_port_forward_command(self, remote_port: int, local_port: int) -> list[str]:
-        parameters = json.dumps(
-            {
-                "portNumber": [str(remote_port)],
-                "localPortNumber": [str(local_port)],
-            }
-        )
         return [
             *self._base_start_session_command(),
             "--document-name",
             "AWS-StartPortForwardingSession",
             "--parameters",
-            parameters,
+            _encode_port_forward_params(remote_port, local_port),
         ]
 
     def _base_start_session_command(self) -> list[str]:
@@ -61,44 +77,122 @@ class AwsInstance:
 
 
 class AwsEc2Service:
-    def __init__(self, profile: str = DEFAULT_PROFILE, region: str = DEFAULT_REGION) -> None:
+    def __init__(
+        self,
+        profile: str = DEFAULT_PROFILE,
+        region: str = DEFAULT_REGION,
+        cache_ttl: float = 30.0,
+    ) -> None:
         self.profile = profile or DEFAULT_PROFILE
         self.region = region or DEFAULT_REGION
-        self._session = boto3.Session(profile_name=self.profile, region_name=self.region)
-
-    def list_instances(self) -> list[InstanceSummary]:
-        ec2 = self._session.client("ec2")
-        paginator = ec2.get_paginator("describe_instances")
+        self.cache_ttl = cache_ttl
+        self._session = _get_session(self.profile, self.region)
+        self._ec2: Any = None
+        self._paginator: Any = None
+        self._list_cache: tuple[float, list[InstanceSummary]] | None = None
+
+    def _describe_instances_paginator(self) -> Any:
+        if self._paginator is None:
+            if self._ec2 is None:
+                self._ec2 = self._session.client("ec2")
+            self._paginator = self._ec2.get_paginator("describe_instances")
+        return self._paginator
+
+    def invalidate(self) -> None:
+        self._list_cache = None
+
+    def iter_instances(self) -> Iterator[list[InstanceSummary]]:
+        """Yield one unsorted batch of summaries per DescribeInstances page."""
+        paginator = self._describe_instances_paginator()
         filters = [
             {
                 "Name": "instance-state-name",
                 "Values": ["pending", "running", "stopping", "stopped"],
             }
         ]
+        # Without a page size the paginator returns arbitrarily large single
+        # pages on big accounts; bound each response so results stream.
+        for page in paginator.paginate(
+            Filters=filters,
+            PaginationConfig={"PageSize": 1000},
+        ):
+            batch: list[InstanceSummary] = []
+            for reservation in page.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    batch.append(self._to_summary(instance))
+            if batch:
+                yield batch
+
+    def list_instances(
+        self,
+        *,
+        ignore_cache: bool = False,
+        on_page: Callable[[list[InstanceSummary]], None] | None = None,
+    ) -> list[InstanceSummary]:
+        if ignore_cache:
+            self._list_cache = None
+        elif (
+            self._list_cache is not None
+            and time.monotonic() - self._list_cache[0] < self.cache_ttl
+        ):
+            return self._list_cache[1]
 
         summaries: list[InstanceSummary] = []
-        for page in paginator.paginate(Filters=filters):
-            reservations = page.get("Reservations", [])
-            for reservation in reservations:
-                for instance in reservation.get("Instances", []):
-                    summaries.append(self._to_summary(instance))
+        for batch in self.iter_instances():
+            summaries.extend(batch)
+            if on_page is not None:
+                on_page(batch)
 
-        summaries.sort(key=lambda item: (item.state != "running", item.display_name.lower()))
+        summaries.sort(key=_instance_sort_key)
+        self._list_cache = (time.monotonic(), summaries)
         return summaries
 
-    @staticmethod
-    def _to_summary(instance: dict[str, Any]) -> InstanceSummary:
+    def _to_summary(self, instance: dict[str, Any]) -> InstanceSummary:
+        tags = {tag["Key"]: tag.get("Value", "") for tag in instance.get("Tags", ())}
         return InstanceSummary(
             instance_id=instance["InstanceId"],
-            name=_tag_value(instance.get("Tags", []), "Name"),
+            name=tags.get("Name", ""),
             state=instance.get("State", {}).get("Name", "unknown"),
             instance_type=instance.get("InstanceType", "unknown"),
             private_ip=instance.get("PrivateIpAddress"),
             public_ip=instance.get("PublicIpAddress"),
             availability_zone=instance.get("Placement", {}).get("AvailabilityZone"),
+            region=self.region,
         )
 
 
+@lru_cache(maxsize=16)
+def get_ec2_service(profile: str, region: str) -> AwsEc2Service:
+    """Shared service per (profile, region) so its list cache survives refreshes."""
+    return AwsEc2Service(profile=profile, region=region)
+
+
+def list_instances_multi(
+    regions: Sequence[str],
+    profile: str = DEFAULT_PROFILE,
+    *,
+    ignore_cache: bool = False,
+) -> list[InstanceSummary]:
+    """List instances across regions concurrently; DescribeInstances is I/O-bound."""
+    services = [get_ec2_service(profile, region or DEFAULT_REGION) for region in regions]
+    if len(services) == 1:
+        return services[0].list_instances(ignore_cache=ignore_cache)
+
+    with ThreadPoolExecutor(max_workers=min(len(services), 8)) as pool:
+        results = list(
+            pool.map(
+                lambda service: service.list_instances(ignore_cache=ignore_cache),
+                services,
+            )
+        )
+    # Each per-region list is already sorted; merge instead of re-sorting.
+    return list(heapq.merge(*results, key=_instance_sort_key))
+
+
+def _instance_sort_key(item: InstanceSummary) -> tuple[bool, str]:
+    return (item.state != "running", item.display_name.lower())
+
+
 def build_ssm_shell_command(
     instance_id: str,
     profile: str = DEFAULT_PROFILE,
@@ -131,6 +225,7 @@ def build_mock_instances(region: str = DEFAULT_REGION) -> list[InstanceSummary]:
             private_ip="10.0.1.21",
             public_ip="54.10.10.21",
             availability_zone=f"{region}a",
+            region=region,
         ),
         InstanceSummary(
             instance_id=f"i-{short_region}112233445566",
@@ -140,6 +235,7 @@ def build_mock_instances(region: str = DEFAULT_REGION) -> list[InstanceSummary]:
             private_ip="10.0.2.34",
             public_ip=None,
             availability_zone=f"{region}b",
+            region=region,
         ),
         InstanceSummary(
             instance_id=f"i-{short_region}998877665544",
@@ -149,12 +245,6 @@ def build_mock_instances(region: str = DEFAULT_REGION) -> list[InstanceSummary]:
             private_ip="10.0.3.10",
             public_ip=None,
             availability_zone=f"{region}c",
+            region=region,
         ),
     ]
-
-
-def _tag_value(tags: Iterable[dict[str, str]], key: str) -> str:
-    for tag in tags:
-        if tag.get("Key") == key:
-            return tag.get("Value", "")
-    return ""
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(slots=True, frozen=True)
-class InstanceSummary:
+class InstanceSummary(NamedTuple):
     instance_id: str
     name: str
     state: str
@@ -12,6 +11,9 @@ class InstanceSummary:
     private_ip: str | None
     public_ip: str | None
     availability_zone: str | None
+    # Region the instance was listed from; needed when the region input
+    # names several regions and commands must target the right one.
+    region: str | None = None
 
     @property
     def display_name(self) -> str:
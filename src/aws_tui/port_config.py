@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import tomllib
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # The C-accelerated loader is ~5-10x faster when libyaml is available.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass(slots=True, frozen=True)
 class PortPreset:
@@ -20,6 +28,10 @@ class PortForwardConfig:
     default_remote_port: int
     default_local_port: int
     presets: tuple[PortPreset, ...]
+    preset_by_key: dict[str, PortPreset] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "preset_by_key", {preset.key: preset for preset in self.presets})
 
 
 DEFAULT_PORT_FORWARD_CONFIG = PortForwardConfig(
@@ -47,8 +59,7 @@ def load_port_forward_config(config_path: str | Path | None = None) -> PortForwa
     if not path.is_file():
         return DEFAULT_PORT_FORWARD_CONFIG
 
-    with path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle) or {}
+    loaded = _load_config_data(str(path), path.stat().st_mtime_ns)
 
     default_remote_port = _coerce_port(
         _safe_mapping_get(loaded, "default_remote_port"),
@@ -66,6 +77,19 @@ def load_port_forward_config(config_path: str | Path | None = None) -> PortForwa
     )
 
 
+@lru_cache(maxsize=4)
+def _load_config_data(path_str: str, mtime_ns: int) -> Any:
+    """Parse the config file, memoized on (path, mtime) so unchanged files are read once."""
+    path = Path(path_str)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return json.loads(path.read_bytes()) or {}
+    if suffix == ".toml":
+        return tomllib.loads(path.read_text(encoding="utf-8")) or {}
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_YamlLoader) or {}
+
+
 def _parse_presets(value: Any) -> tuple[PortPreset, ...]:
     parsed: list[PortPreset] = []
     try:
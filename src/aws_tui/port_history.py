@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 from uuid import uuid4
 
 
@@ -11,8 +15,9 @@ DEFAULT_HISTORY_DB_PATH = Path("port-history.db")
 ACTIVE_STATUSES = ("active", "simulated-active")
 
 
-@dataclass(slots=True, frozen=True)
-class PortForwardRecord:
+class PortForwardRecord(NamedTuple):
+    # NamedTuple's C-level __new__ is markedly cheaper than the frozen
+    # dataclass __init__ when list_all/list_for_instance decode many rows.
     record_id: str
     forward_name: str
     instance_id: str
@@ -27,8 +32,14 @@ class PortForwardRecord:
 
 
 class PortForwardHistoryStore:
+    # Well above realistic active-forward counts; bounds memory if history grows.
+    _RECORD_CACHE_SIZE = 256
+
     def __init__(self, path: str | Path | None = None) -> None:
         self.path = Path(path).expanduser() if path else DEFAULT_HISTORY_DB_PATH
+        self._record_cache: OrderedDict[str, PortForwardRecord] = OrderedDict()
+        self._db_lock = threading.Lock()
+        self._conn = self._open_connection()
         self._init_db()
         self._mark_unfinished_as_interrupted()
 
@@ -79,6 +90,7 @@ class PortForwardHistoryStore:
                     record.note,
                 ),
             )
+        self._cache_record(record)
         return record
 
     def update(self, record_id: str, **changes: object) -> PortForwardRecord | None:
@@ -116,11 +128,32 @@ class PortForwardHistoryStore:
             )
             if cursor.rowcount == 0:
                 return None
+        self._record_cache.pop(record_id, None)
         return self.get(record_id)
 
+    def update_many(self, updates: Iterable[tuple[str, str, str | None, str | None]]) -> None:
+        """Apply (record_id, status, ended_at, note) updates in one transaction."""
+        rows = [
+            (status, ended_at, note, record_id)
+            for record_id, status, ended_at, note in updates
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE port_forward_history SET status = ?, ended_at = ?, note = ? WHERE record_id = ?",
+                rows,
+            )
+        for _, _, _, record_id in rows:
+            self._record_cache.pop(record_id, None)
+
     def get(self, record_id: str) -> PortForwardRecord | None:
+        cached = self._record_cache.get(record_id)
+        if cached is not None:
+            self._record_cache.move_to_end(record_id)
+            return cached
         with self._connect() as conn:
-            row = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT
                     record_id, forward_name, instance_id, instance_name, remote_port, local_port,
@@ -129,12 +162,60 @@ class PortForwardHistoryStore:
                 WHERE record_id = ?
                 """,
                 (record_id,),
-            ).fetchone()
-        return self._record_from_row(row)
+            )
+            cursor.row_factory = None
+            row = cursor.fetchone()
+        record = self._record_from_row(row)
+        if record is not None:
+            self._cache_record(record)
+        return record
 
-    def list_for_instance(self, instance_id: str) -> list[PortForwardRecord]:
+    def get_many(self, record_ids: Iterable[str]) -> dict[str, PortForwardRecord]:
+        ids = tuple(record_ids)
+        if not ids:
+            return {}
+        found: dict[str, PortForwardRecord] = {}
+        misses: list[str] = []
+        for record_id in ids:
+            cached = self._record_cache.get(record_id)
+            if cached is not None:
+                self._record_cache.move_to_end(record_id)
+                found[record_id] = cached
+            else:
+                misses.append(record_id)
+        if not misses:
+            return found
+
+        placeholders = ", ".join("?" for _ in misses)
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
+                f"""
+                SELECT
+                    record_id, forward_name, instance_id, instance_name, remote_port, local_port,
+                    started_at, ended_at, status, command, note
+                FROM port_forward_history
+                WHERE record_id IN ({placeholders})
+                """,
+                misses,
+            )
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+        for row in rows:
+            record = self._record_from_row(row)
+            if record is not None:
+                found[record.record_id] = record
+                self._cache_record(record)
+        return found
+
+    def list_for_instance(
+        self,
+        instance_id: str,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[PortForwardRecord]:
+        with self._connect() as conn:
+            cursor = conn.execute(
                 """
                 SELECT
                     record_id, forward_name, instance_id, instance_name, remote_port, local_port,
@@ -142,14 +223,17 @@ class PortForwardHistoryStore:
                 FROM port_forward_history
                 WHERE instance_id = ?
                 ORDER BY started_at DESC
+                LIMIT ? OFFSET ?
                 """,
-                (instance_id,),
-            ).fetchall()
+                (instance_id, -1 if limit is None else limit, offset),
+            )
+            cursor.row_factory = None  # plain tuples decode faster than sqlite3.Row
+            rows = cursor.fetchall()
         return [record for row in rows if (record := self._record_from_row(row)) is not None]
 
     def list_all(self) -> list[PortForwardRecord]:
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT
                     record_id, forward_name, instance_id, instance_name, remote_port, local_port,
@@ -157,11 +241,12 @@ class PortForwardHistoryStore:
                 FROM port_forward_history
                 ORDER BY started_at DESC
                 """
-            ).fetchall()
+            )
+            cursor.row_factory = None
+            rows = cursor.fetchall()
         return [record for row in rows if (record := self._record_from_row(row)) is not None]
 
     def _init_db(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         with self._connect() as conn:
             conn.execute(
                 """
@@ -186,6 +271,12 @@ class PortForwardHistoryStore:
                 ON port_forward_history (instance_id, started_at DESC)
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_port_history_started
+                ON port_forward_history (started_at DESC)
+                """
+            )
             self._ensure_columns(conn)
 
     def _ensure_columns(self, conn: sqlite3.Connection) -> None:
@@ -216,31 +307,67 @@ class PortForwardHistoryStore:
                 ("interrupted", now, "Marked interrupted after app restart.", *ACTIVE_STATUSES),
             )
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.path)
+    def _cache_record(self, record: PortForwardRecord) -> None:
+        self._record_cache[record.record_id] = record
+        self._record_cache.move_to_end(record.record_id)
+        while len(self._record_cache) > self._RECORD_CACHE_SIZE:
+            self._record_cache.popitem(last=False)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # cached_statements keeps the compiled form of our repeated
+        # SELECT/UPDATE statements warm across calls.
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=128)
         conn.row_factory = sqlite3.Row
+        # WAL halves the fsync cost of single-record updates and keeps
+        # readers unblocked while a write commits.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the long-lived connection under the store lock as one transaction."""
+        with self._db_lock, self._conn:
+            yield self._conn
+
     @staticmethod
-    def _record_from_row(row: sqlite3.Row | None) -> PortForwardRecord | None:
+    def _record_from_row(row: tuple | None) -> PortForwardRecord | None:
         if row is None:
             return None
+        # SQLite returns correctly typed values; unpack positionally and
+        # only normalize the nullable text columns.
+        (
+            record_id,
+            forward_name,
+            instance_id,
+            instance_name,
+            remote_port,
+            local_port,
+            started_at,
+            ended_at,
+            status,
+            command,
+            note,
+        ) = row
         return PortForwardRecord(
-            record_id=str(row["record_id"]),
-            forward_name=_coerce_forward_name(
-                str(row["forward_name"]) if row["forward_name"] else "",
-                local_port=int(row["local_port"]),
-                remote_port=int(row["remote_port"]),
+            record_id,
+            _coerce_forward_name(
+                forward_name or "",
+                local_port=local_port,
+                remote_port=remote_port,
             ),
-            instance_id=str(row["instance_id"]),
-            instance_name=str(row["instance_name"]),
-            remote_port=int(row["remote_port"]),
-            local_port=int(row["local_port"]),
-            started_at=str(row["started_at"]),
-            ended_at=str(row["ended_at"]) if row["ended_at"] else None,
-            status=str(row["status"]),
-            command=str(row["command"]),
-            note=str(row["note"]) if row["note"] else None,
+            instance_id,
+            instance_name,
+            remote_port,
+            local_port,
+            started_at,
+            ended_at or None,
+            status,
+            command,
+            note or None,
         )
 
 